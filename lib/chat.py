@@ -1,114 +1,532 @@
 #!/usr/bin/env python3
 """AgentChat daemon helper - read/send messages and track timestamps."""
 
-import argparse
+import functools
+import heapq
 import json
 import os
 import sys
+import tempfile
+import zlib
+from dataclasses import dataclass
 from pathlib import Path
+from typing import NamedTuple, Optional
+
+try:
+    # orjson parses raw bytes in C; stdlib json accepts bytes too, just slower
+    from orjson import JSONDecodeError, loads
+except ImportError:
+    from json import JSONDecodeError, loads
+
+# Most iovecs a single writev() accepts (POSIX minimum, Linux's limit)
+IOV_MAX = 1024
 
 # Default daemon directory (can be overridden with --daemon-dir)
 DEFAULT_DAEMON_DIR = Path.cwd() / ".agentchat" / "daemons" / "default"
 
 
-def get_paths(daemon_dir: Path):
+@dataclass(frozen=True, slots=True)
+class Paths:
+    """File paths for a daemon directory."""
+    inbox: Path
+    outbox: Path
+    last_ts: Path
+    last_off: Path  # Byte cursor into inbox
+    newdata: Path  # Semaphore for new messages
+
+
+@functools.lru_cache(maxsize=None)
+def get_paths(daemon_dir: Path) -> Paths:
     """Get file paths for a daemon directory."""
-    return {
-        "inbox": daemon_dir / "inbox.jsonl",
-        "outbox": daemon_dir / "outbox.jsonl",
-        "last_ts": daemon_dir / "last_ts",
-        "newdata": daemon_dir / "newdata",  # Semaphore for new messages
-    }
+    return Paths(
+        inbox=daemon_dir / "inbox.jsonl",
+        outbox=daemon_dir / "outbox.jsonl",
+        last_ts=daemon_dir / "last_ts",
+        last_off=daemon_dir / "last_off",
+        newdata=daemon_dir / "newdata",
+    )
+
+
+# last_ts holds a zero-padded decimal so it can be rewritten in place with a
+# single pwrite, while staying readable by monitor.py and `cat`
+LAST_TS_FORMAT = b"%020d\n"
+
+# Open last_ts descriptors, keyed by path
+_LAST_TS_FDS: dict = {}
+
+# last_ts values seen or written by this process, keyed by path
+_TS_CACHE: dict = {}
+
+
+def _last_ts_fd(path: Path, create: bool) -> int:
+    """Get a cached read/write fd for last_ts; O_DSYNC makes each pwrite durable."""
+    fd = _LAST_TS_FDS.get(path)
+    if fd is None:
+        flags = os.O_RDWR | os.O_DSYNC | (os.O_CREAT if create else 0)
+        fd = _LAST_TS_FDS[path] = os.open(path, flags, 0o644)
+    return fd
+
+
+def get_last_ts(paths: Paths) -> int:
+    """Get last seen timestamp.
+
+    The value is read from disk once per process and then served from
+    _TS_CACHE, which set_last_ts keeps current. A long wait therefore does
+    not re-read it every pass, but also won't see changes made by another
+    process until it restarts.
+    """
+    ts = _TS_CACHE.get(paths.last_ts)
+    if ts is not None:
+        return ts
+    try:
+        fd = _last_ts_fd(paths.last_ts, create=False)
+    except FileNotFoundError:
+        return 0
+    data = os.pread(fd, 64, 0)
+    ts = _TS_CACHE[paths.last_ts] = int(data) if data.strip() else 0
+    return ts
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    """Replace path with data; a crash leaves either the old or new contents.
+
+    The temp file gets a unique name, so concurrent writers (another chat.py,
+    or monitor.py) never write into each other's file before the rename.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".")
+    try:
+        try:
+            os.write(fd, data.encode())
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def set_last_ts(paths: Paths, ts: int) -> None:
+    """Update last seen timestamp.
+
+    Every value is written at the same fixed width, so one pwrite replaces
+    the whole file with no truncate and never leaves it empty.
+    """
+    os.pwrite(_last_ts_fd(paths.last_ts, create=True), LAST_TS_FORMAT % ts, 0)
+    _TS_CACHE[paths.last_ts] = ts
+
+
+def get_cursor(paths: Paths):
+    """Get stored inbox cursor as (offset, inode, crc, ts), or None."""
+    try:
+        off, ino, crc, ts = map(int, paths.last_off.read_text().split())
+    except (FileNotFoundError, ValueError):
+        return None
+    return off, ino, crc, ts
+
+
+def advance_cursor(paths: Paths, ts: int, cursor) -> None:
+    """Mark ts as seen and remember the inbox position it was reached at.
+
+    cursor is the (offset, inode, crc) triple returned by read_new. It is
+    published with a single rename, together with the ts it belongs to, so
+    a stale cursor is never paired with a newer last_ts.
+    """
+    if cursor is not None:
+        _write_atomic(paths.last_off, "%d %d %d %d" % (*cursor, ts))
+    set_last_ts(paths, ts)
+
 
+def _load_inbox(paths: Paths):
+    """Read the whole inbox into memory, returning (data, stat).
+
+    Not mmap'd: the daemon trims the inbox in place, and a mapping that
+    shrinks underneath the reader faults with SIGBUS instead of giving a
+    short read.
+    """
+    try:
+        with open(paths.inbox, "rb") as f:
+            _advise_sequential(f)
+            return f.read(), os.fstat(f.fileno())
+    except FileNotFoundError:
+        return b"", None
+
+
+def _advise_sequential(f) -> None:
+    """Hint that f is about to be read through once, so readahead can ramp up."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def _line_crc(buf, end: int) -> int:
+    """Checksum of the line ending at end, used to recognise a cursor position."""
+    start = buf.rfind(b"\n", 0, end - 1) + 1
+    return zlib.crc32(buf[start:end])
+
+
+def _pread_line_crc(fd: int, end: int) -> int:
+    """_line_crc of the file behind fd, reading only the bytes before end."""
+    window = 4096
+    while True:
+        start = max(0, end - window)
+        buf = os.pread(fd, end - start, start)
+        nl = buf.rfind(b"\n", 0, len(buf) - 1)
+        if nl != -1 or start == 0:
+            return zlib.crc32(buf[nl + 1:])
+        window *= 2
+
+
+class Batch(NamedTuple):
+    """Unseen messages plus what advance_cursor needs to mark them seen."""
+    messages: list
+    max_ts: int
+    cursor: Optional[tuple]
 
-def get_last_ts(paths: dict) -> int:
-    """Get last seen timestamp."""
-    if paths["last_ts"].exists():
-        return int(paths["last_ts"].read_text().strip())
-    return 0
 
+def _message_filter(include_replay: bool, include_server: bool):
+    """Build the per-message predicate for one read, or None to keep everything.
 
-def set_last_ts(paths: dict, ts: int) -> None:
-    """Update last seen timestamp."""
-    paths["last_ts"].write_text(str(ts))
+    The flags are fixed for a whole scan, so branch on them once here rather
+    than re-testing both for every line.
+    """
+    if include_replay and include_server:
+        return None
+    if include_server:
+        return lambda msg: not msg.get("replay", False)
+    if include_replay:
+        return lambda msg: msg.get("from") != "@server"
+    return lambda msg: not msg.get("replay", False) and msg.get("from") != "@server"
+
+
+def _resume_point(skipped: list, max_ts: int, end: int) -> int:
+    """Where the next cursor read must start: the first skipped line newer than max_ts.
 
+    skipped holds (offset, ts) for unseen lines the filter rejected. Once
+    last_ts becomes max_ts, any of them with a larger ts is still unseen for
+    a reader with another filter (check shows @server lines that wait drops),
+    so the cursor must not move past it.
+    """
+    return min((off for off, ts in skipped if ts > max_ts), default=end)
 
-def read_inbox(paths: dict, since_ts: int = None, limit: int = 50, include_replay: bool = False) -> list:
-    """Read messages from inbox, optionally filtering by timestamp."""
+
+def _scan_forward(buf, pos: int, end: int, since_ts: int, limit: int, keep):
+    """Parse lines between pos and end, oldest first. Returns (messages, max_ts, resume).
+
+    With a limit, only the newest limit messages are kept, in a min-heap on
+    (ts, line number), so memory stays O(limit) however much is unread.
+    resume is the offset a cursor may advance to (see _resume_point).
+    """
+    messages = []
+    heap = []
+    skipped = []
+    seq = 0
+    max_ts = since_ts
+    in_order = True
+    stop = end
+    while pos < end:
+        nl = buf.find(b"\n", pos, end)
+        if nl == -1:
+            nl = end
+        start = pos
+        line = buf[pos:nl]
+        pos = nl + 1
+        if not line:
+            continue
+        try:
+            msg = loads(line)
+        except JSONDecodeError:
+            continue
+
+        ts = msg.get("ts", 0)
+        if ts > since_ts and (keep is None or keep(msg)):
+            if ts >= max_ts:
+                max_ts = ts
+            else:
+                in_order = False
+            if not limit:
+                messages.append(msg)
+            elif len(heap) < limit:
+                heapq.heappush(heap, (ts, seq, msg))
+            else:
+                heapq.heappushpop(heap, (ts, seq, msg))
+            seq += 1
+        elif ts > since_ts:
+            skipped.append((start, ts))
+
+    if limit:
+        messages = [msg for _, _, msg in sorted(heap)]
+    elif not in_order:
+        messages.sort(key=lambda m: m.get("ts", 0))
+    return messages, max_ts, _resume_point(skipped, max_ts, stop)
+
+
+def _scan_backward(buf, end: int, since_ts: int, limit: int, keep):
+    """Parse lines from end back to the first already-seen one. Returns (messages, max_ts, resume).
+
+    With a limit, the newest limit messages by ts are kept, in a min-heap on
+    (ts, position) exactly as _scan_forward keeps them. Live messages are
+    appended in ts order and replays only carry older timestamps, so nothing
+    before a live message is newer than it: the walk stops at the first live
+    message that is already seen or that could not displace the oldest kept.
+    resume is the offset a cursor may advance to (see _resume_point).
+    """
+    messages = []
+    heap = []
+    skipped = []
+    seq = 0  # Counts down, so a later line wins a ts tie as in a stable sort
+    max_ts = since_ts
+    prev_ts = None
+    in_order = True
+    stop = end
+    while end > 0:
+        start = buf.rfind(b"\n", 0, end) + 1
+        line = buf[start:end]
+        end = start - 1
+        if not line:
+            continue
+        try:
+            msg = loads(line)
+        except JSONDecodeError:
+            continue
+
+        ts = msg.get("ts", 0)
+        live = not msg.get("replay", False)
+        if live and (ts <= since_ts or (limit and len(heap) == limit and ts <= heap[0][0])):
+            # Replays carry historical timestamps, so only a live
+            # message marks the point where everything older was seen
+            break
+        if ts > since_ts and (keep is None or keep(msg)):
+            if ts > max_ts:
+                max_ts = ts
+            if not limit:
+                messages.append(msg)
+                if prev_ts is not None and ts > prev_ts:
+                    in_order = False
+                prev_ts = ts
+            elif len(heap) < limit:
+                heapq.heappush(heap, (ts, seq, msg))
+            else:
+                heapq.heappushpop(heap, (ts, seq, msg))
+            seq -= 1
+        elif ts > since_ts:
+            skipped.append((start, ts))
+
+    resume = _resume_point(skipped, max_ts, stop)
+    if limit:
+        return [msg for _, _, msg in sorted(heap)], max_ts, resume
+    # Return in arrival order, which is already sorted unless the daemon
+    # appended something out of ts order
+    messages.reverse()
+    if not in_order:
+        messages.sort(key=lambda m: m.get("ts", 0))
+    return messages, max_ts, resume
+
+
+def read_inbox(paths: Paths, since_ts: int = None, limit: int = 50, include_replay: bool = False) -> list:
+    """Read messages from inbox, optionally filtering by timestamp.
+
+    The inbox is append-only, so anything newer than since_ts sits at the
+    tail. Scan backwards from EOF and stop at the first live message that
+    is not newer than since_ts, or once limit messages have been collected.
+    A full unlimited read has nothing to stop on, so it simply walks forward.
+    """
+    if limit < 0:
+        raise ValueError(f"limit must be >= 0, got {limit}")
     if since_ts is None:
         since_ts = get_last_ts(paths)
 
-    messages = []
-    if not paths["inbox"].exists():
-        return messages
-
-    with open(paths["inbox"]) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                msg = json.loads(line)
-                ts = msg.get("ts", 0)
-                is_replay = msg.get("replay", False)
+    data, _ = _load_inbox(paths)
+    if not data:
+        return []
+    keep = _message_filter(include_replay, True)
+    if since_ts <= 0 and not limit:
+        messages, _, _ = _scan_forward(data, 0, len(data), since_ts, limit, keep)
+    else:
+        messages, _, _ = _scan_backward(data, len(data), since_ts, limit, keep)
+    return messages
 
-                if ts > since_ts and (include_replay or not is_replay):
-                    messages.append(msg)
-            except json.JSONDecodeError:
-                continue
 
-    # Sort by timestamp and limit
-    messages.sort(key=lambda m: m.get("ts", 0))
-    return messages[-limit:] if limit else messages
+def read_new(paths: Paths, limit: int = 50, include_replay: bool = False,
+             include_server: bool = True) -> Batch:
+    """Read unseen messages, resuming from the stored inbox cursor.
 
+    Pass the returned max_ts and cursor to advance_cursor once the messages
+    are consumed. Only complete lines are consumed, so a line the daemon is
+    still appending is picked up on the next call. The cursor is checked
+    against the line before it with a small pread, and only the bytes after
+    it are read. If it no longer matches the inbox (the daemon truncated it,
+    it was replaced, or last_ts was changed elsewhere) the whole inbox is
+    read and scanned back by timestamp instead.
+    """
+    if limit < 0:
+        raise ValueError(f"limit must be >= 0, got {limit}")
+    since_ts = get_last_ts(paths)
 
-def send_message(paths: dict, to: str, content: str) -> None:
+    try:
+        f = open(paths.inbox, "rb")
+    except FileNotFoundError:
+        return Batch([], since_ts, None)
+    with f:
+        st = os.fstat(f.fileno())
+        base = 0
+        cursor = get_cursor(paths)
+        if (cursor is not None and cursor[3] == since_ts and cursor[1] == st.st_ino
+                and 0 < cursor[0] <= st.st_size
+                and _pread_line_crc(f.fileno(), cursor[0]) == cursor[2]):
+            base = cursor[0]
+            f.seek(base)
+        else:
+            _advise_sequential(f)
+        data = f.read()
+
+    # Offsets in data are relative to base, which is always a line start
+    end = data.rfind(b"\n") + 1
+    if end == 0:
+        return Batch([], since_ts, None)
+
+    keep = _message_filter(include_replay, include_server)
+    if base:
+        messages, max_ts, resume = _scan_forward(data, 0, end, since_ts, limit, keep)
+    else:
+        messages, max_ts, resume = _scan_backward(data, end, since_ts, limit, keep)
+
+    if base + resume == 0:
+        return Batch(messages, max_ts, None)
+    crc = cursor[2] if resume == 0 else _line_crc(data, resume)
+    return Batch(messages, max_ts, (base + resume, st.st_ino, crc))
+
+
+@functools.lru_cache(maxsize=None)
+def _outbox_fd(path: Path) -> int:
+    """Open the outbox for appending, once per process.
+
+    The daemon empties the outbox by truncating it in place, so a cached
+    O_APPEND descriptor keeps writing to the live file at its current end.
+    """
+    return os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def send_messages(paths: Paths, messages: list) -> None:
+    """Send several messages, given as (to, content) pairs, in one write.
+
+    Each O_APPEND write lands whole at the end of the file, so a batch is
+    never interleaved with other writers or split by the daemon's truncate.
+    """
+    lines = [(json.dumps({"to": to, "content": content}) + "\n").encode()
+             for to, content in messages]
+    fd = _outbox_fd(paths.outbox)
+    for i in range(0, len(lines), IOV_MAX):
+        os.writev(fd, lines[i:i + IOV_MAX])
+
+
+def send_message(paths: Paths, to: str, content: str) -> None:
     """Send a message by appending to outbox."""
-    msg = {"to": to, "content": content}
-    with open(paths["outbox"], "a") as f:
-        f.write(json.dumps(msg) + "\n")
+    send_messages(paths, [(to, content)])
 
 
-def check_new(paths: dict, update_ts: bool = True) -> list:
+def check_new(paths: Paths, update_ts: bool = True) -> list:
     """Check for new messages and optionally update timestamp."""
-    messages = read_inbox(paths)
+    messages, max_ts, cursor = read_new(paths)
 
     if messages and update_ts:
-        max_ts = max(m.get("ts", 0) for m in messages)
-        set_last_ts(paths, max_ts)
+        advance_cursor(paths, max_ts, cursor)
 
     return messages
 
 
-def poll_new(paths: dict):
+def poll_new(paths: Paths):
     """Poll for new messages using semaphore file. Returns None if no new data."""
-    # Fast path: check if semaphore exists
-    if not paths["newdata"].exists():
-        return None
-
-    # Semaphore exists, read messages
-    messages = read_inbox(paths)
-
-    # Delete semaphore
+    # Unlinking the semaphore both detects and clears it in one syscall; a
+    # write that lands after this recreates it for the next poll
     try:
-        paths["newdata"].unlink()
+        os.unlink(paths.newdata)
     except FileNotFoundError:
-        pass  # Race condition, already deleted
+        return None
+
+    messages, max_ts, cursor = read_new(paths)
 
     # Update timestamp if we got messages
     if messages:
-        max_ts = max(m.get("ts", 0) for m in messages)
-        set_last_ts(paths, max_ts)
+        advance_cursor(paths, max_ts, cursor)
 
     return messages
 
 
-def wait_for_messages(paths: dict, interval: float = 2.0, timeout: float = 300.0):
-    """Block until new messages arrive. Returns messages or empty list on timeout."""
+# inotify(7) event bits used to watch the daemon directory. scripts/monitor.py
+# keeps a standalone copy of these helpers; fix event parsing in both places.
+IN_MODIFY = 0x002
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+
+
+def _inotify_watch(dirs, mask: int):
+    """Open a non-blocking inotify fd watching dirs, or None if unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    import ctypes
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+
+    for d in dirs:
+        if libc.inotify_add_watch(fd, os.fsencode(d), mask) < 0:
+            os.close(fd)
+            return None
+    return fd
+
+
+def _inotify_names(fd: int) -> set:
+    """Drain pending inotify events and return the file names they touched."""
+    import struct
+
+    names = set()
+    while True:
+        try:
+            buf = os.read(fd, 4096)
+        except BlockingIOError:
+            return names
+        pos = 0
+        while pos < len(buf):
+            _, _, _, size = struct.unpack_from("iIII", buf, pos)
+            pos += 16
+            names.add(os.fsdecode(buf[pos:pos + size].rstrip(b"\0")))
+            pos += size
+
+
+def _watch_wait(poller, watch_fd: int, wake_fd: int, deadline: float, names: set) -> None:
+    """Block until one of names changes, a signal arrives, or deadline passes."""
+    import time
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        ready = {fd for fd, _ in poller.poll(remaining)}
+        if wake_fd in ready:
+            os.read(wake_fd, 512)
+            return
+        if not ready or _inotify_names(watch_fd) & names:
+            return
+
+
+def wait_for_messages(paths: Paths, interval: float = 2.0, timeout: float = 300.0):
+    """Block until new messages arrive. Returns messages or empty list on timeout.
+
+    On Linux this sleeps on inotify until newdata or the stop file changes;
+    elsewhere it falls back to checking every interval seconds.
+    """
     import signal
     import time
 
-    stop_file = paths["inbox"].parent.parent.parent / "stop"
+    stop_file = paths.inbox.parent.parent.parent / "stop"
 
     # Handle interrupts gracefully
     interrupted = False
@@ -118,48 +536,114 @@ def wait_for_messages(paths: dict, interval: float = 2.0, timeout: float = 300.0
 
     old_handler = signal.signal(signal.SIGINT, handle_signal)
 
+    watch_fd = _inotify_watch([paths.inbox.parent, stop_file.parent],
+                              IN_CREATE | IN_MOVED_TO | IN_MODIFY)
+    watch_names = {paths.newdata.name, stop_file.name}
+    if watch_fd is not None:
+        import select
+
+        # Signal handlers don't interrupt a blocking poll; the wakeup fd does
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_w, False)
+        old_wakeup = signal.set_wakeup_fd(wake_w)
+        poller = select.epoll()
+        poller.register(watch_fd, select.EPOLLIN)
+        poller.register(wake_r, select.EPOLLIN)
+
     try:
-        start = time.time()
-        while not interrupted and (time.time() - start) < timeout:
-            # Check stop file
-            if stop_file.exists():
-                try:
-                    stop_file.unlink()
-                except FileNotFoundError:
-                    pass
+        deadline = time.monotonic() + timeout
+        while not interrupted and time.monotonic() < deadline:
+            # Check stop file (unlink doubles as the existence test)
+            try:
+                os.unlink(stop_file)
                 return []  # Signal to stop
+            except FileNotFoundError:
+                pass
 
-            # Check semaphore
-            if paths["newdata"].exists():
-                messages = read_inbox(paths)
-                # Filter out @server messages
-                messages = [m for m in messages if m.get("from") != "@server"]
-
+            # Consume semaphore the same way
+            try:
+                os.unlink(paths.newdata)
+            except FileNotFoundError:
+                pass
+            else:
+                # Skip @server noise (welcome messages, etc.)
+                messages, max_ts, cursor = read_new(paths, include_server=False)
                 if messages:
-                    # Update timestamp
-                    max_ts = max(m.get("ts", 0) for m in messages)
-                    set_last_ts(paths, max_ts)
-                    # Clear semaphore
-                    try:
-                        paths["newdata"].unlink()
-                    except FileNotFoundError:
-                        pass
+                    advance_cursor(paths, max_ts, cursor)
                     return messages
+                # Semaphore but no messages after filtering - keep waiting
 
-                # Semaphore but no messages after filtering - clear and continue
-                try:
-                    paths["newdata"].unlink()
-                except FileNotFoundError:
-                    pass
-
-            time.sleep(interval)
+            if watch_fd is None:
+                time.sleep(interval)
+            else:
+                _watch_wait(poller, watch_fd, wake_r, deadline, watch_names)
 
         return []  # Timeout
     finally:
         signal.signal(signal.SIGINT, old_handler)
+        if watch_fd is not None:
+            signal.set_wakeup_fd(old_wakeup)
+            poller.close()
+            for fd in (watch_fd, wake_r, wake_w):
+                os.close(fd)
+
+
+def emit(messages: list) -> None:
+    """Print messages as JSON lines with a single write."""
+    if not messages:
+        return
+    out = "".join(json.dumps(msg) + "\n" for msg in messages)
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None:
+        sys.stdout.write(out)  # Replaced stdout (e.g. captured in tests)
+    else:
+        stream.write(out.encode())
+        stream.flush()
+
+
+def _parse_fast(argv: list):
+    """Parse the common one-shot commands (ts, send, poll) without argparse.
+
+    Returns None for anything else, including help and unknown or dashed
+    arguments, so the full parser handles those and reports errors.
+    """
+    from types import SimpleNamespace
+
+    daemon_dir = DEFAULT_DAEMON_DIR
+    if len(argv) >= 2 and argv[0] == "--daemon-dir":
+        daemon_dir, argv = Path(argv[1]), argv[2:]
+    elif argv and argv[0].startswith("--daemon-dir="):
+        daemon_dir, argv = Path(argv[0].split("=", 1)[1]), argv[1:]
+
+    if not argv or any(a.startswith("-") for a in argv[1:]):
+        return None
+    command, rest = argv[0], argv[1:]
+
+    if command == "ts" and len(rest) <= 1:
+        try:
+            value = int(rest[0]) if rest else None
+        except ValueError:
+            return None
+        return SimpleNamespace(daemon_dir=daemon_dir, command=command, value=value)
+    if command == "send" and len(rest) == 2:
+        return SimpleNamespace(daemon_dir=daemon_dir, command=command, to=rest[0], content=rest[1])
+    if command == "poll" and not rest:
+        return SimpleNamespace(daemon_dir=daemon_dir, command=command)
+    return None
+
+
+def _parse_args():
+    import argparse
+
+    def non_negative_int(value):
+        try:
+            n = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+        if n < 0:
+            raise argparse.ArgumentTypeError(f"must be >= 0, got {n}")
+        return n
 
-
-def main():
     parser = argparse.ArgumentParser(description="AgentChat daemon helper")
     parser.add_argument("--daemon-dir", type=Path, default=DEFAULT_DAEMON_DIR,
                         help="Daemon directory path")
@@ -169,7 +653,7 @@ def main():
     # read command
     read_p = subparsers.add_parser("read", help="Read inbox messages")
     read_p.add_argument("--since", type=int, help="Only messages after this timestamp")
-    read_p.add_argument("--limit", type=int, default=50, help="Max messages to return")
+    read_p.add_argument("--limit", type=non_negative_int, default=50, help="Max messages to return (0 for all)")
     read_p.add_argument("--replay", action="store_true", help="Include replay messages")
     read_p.add_argument("--all", action="store_true", help="Read all messages (ignore last_ts)")
 
@@ -191,17 +675,21 @@ def main():
 
     # wait command - block until messages arrive
     wait_p = subparsers.add_parser("wait", help="Block until new messages arrive")
-    wait_p.add_argument("--interval", type=float, default=2.0, help="Poll interval in seconds")
+    wait_p.add_argument("--interval", type=float, default=2.0, help="Poll interval in seconds (without inotify)")
     wait_p.add_argument("--timeout", type=float, default=300.0, help="Max wait time in seconds")
 
-    args = parser.parse_args()
+    return parser.parse_args()
+
+
+def main():
+    # Agents shell out per message, so skip argparse's import cost when we can
+    args = _parse_fast(sys.argv[1:]) or _parse_args()
     paths = get_paths(args.daemon_dir)
 
     if args.command == "read":
         since = 0 if args.all else (args.since if args.since else get_last_ts(paths))
         messages = read_inbox(paths, since_ts=since, limit=args.limit, include_replay=args.replay)
-        for msg in messages:
-            print(json.dumps(msg))
+        emit(messages)
 
     elif args.command == "send":
         send_message(paths, args.to, args.content)
@@ -209,8 +697,7 @@ def main():
 
     elif args.command == "check":
         messages = check_new(paths, update_ts=not args.no_update)
-        for msg in messages:
-            print(json.dumps(msg))
+        emit(messages)
         if not messages:
             print("No new messages", file=sys.stderr)
 
@@ -227,14 +714,12 @@ def main():
             # No semaphore = no new data, exit silently
             pass
         elif messages:
-            for msg in messages:
-                print(json.dumps(msg))
+            emit(messages)
         # Empty list = semaphore existed but no new messages after filtering
 
     elif args.command == "wait":
         messages = wait_for_messages(paths, interval=args.interval, timeout=args.timeout)
-        for msg in messages:
-            print(json.dumps(msg))
+        emit(messages)
 
 
 if __name__ == "__main__":
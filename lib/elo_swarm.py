@@ -10,19 +10,31 @@ Tests:
 4. What's the equilibrium distribution?
 """
 
-import random
 import math
-import statistics
+import os
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
-from collections import defaultdict
 import json
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; rounds resolve through NumPy instead
+    njit = None
+
+# Compiles the scalar round kernel below when numba is installed
+_jit = njit(cache=True) if njit is not None else (lambda f: f)
 
 # ============ ELO CONSTANTS (matching our implementation) ============
 DEFAULT_RATING = 1200
 MINIMUM_RATING = 100
 ELO_DIVISOR = 400
 
+# Ratings round to whole points and never need more than float32 precision
+RATING_DTYPE = np.float32
+
 # K-factor thresholds
 K_NEW = 32          # < 30 transactions
 K_INTERMEDIATE = 24  # < 100 transactions
@@ -31,21 +43,36 @@ K_ESTABLISHED = 16   # >= 100 transactions
 TRANSACTIONS_NEW = 30
 TRANSACTIONS_INTERMEDIATE = 100
 
+# K-factor indexed by transaction count, capped at TRANSACTIONS_INTERMEDIATE
+K_TABLE = (
+    (K_NEW,) * TRANSACTIONS_NEW
+    + (K_INTERMEDIATE,) * (TRANSACTIONS_INTERMEDIATE - TRANSACTIONS_NEW)
+    + (K_ESTABLISHED,)
+)
+K_LOOKUP = np.array(K_TABLE, dtype=RATING_DTYPE)
+
+SEED = 42  # Reproducibility
+
+LN10 = math.log(10)
+
 
 # ============ ELO CALCULATIONS ============
 def calculate_expected(self_rating: float, opponent_rating: float) -> float:
     """Standard ELO expected outcome"""
     exponent = (opponent_rating - self_rating) / ELO_DIVISOR
-    return 1 / (1 + math.pow(10, exponent))
+    return 1.0 / (1.0 + math.exp(LN10 * exponent))
+
+
+def expected_scores(self_ratings: np.ndarray, opponent_ratings: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_expected over arrays of pairings"""
+    # In float32, exp overflows past a ~15000 point gap; inf gives the right 0
+    with np.errstate(over='ignore'):
+        return 1.0 / (1.0 + np.exp((opponent_ratings - self_ratings) * (LN10 / ELO_DIVISOR)))
 
 
 def get_k_factor(transactions: int) -> int:
     """K-factor based on experience"""
-    if transactions < TRANSACTIONS_NEW:
-        return K_NEW
-    elif transactions < TRANSACTIONS_INTERMEDIATE:
-        return K_INTERMEDIATE
-    return K_ESTABLISHED
+    return K_TABLE[min(transactions, TRANSACTIONS_INTERMEDIATE)]
 
 
 def calculate_completion_gain(self_rating: float, opponent_rating: float, k: int, halve: bool = True) -> int:
@@ -65,8 +92,13 @@ def calculate_dispute_loss(self_rating: float, opponent_rating: float, k: int) -
 
 
 # ============ AGENT TYPES ============
-@dataclass
+AGENT_TYPES = ('reliable', 'unreliable', 'malicious', 'selective')
+RELIABLE, UNRELIABLE, MALICIOUS, SELECTIVE = range(len(AGENT_TYPES))
+
+
+@dataclass(slots=True)
 class Agent:
+    """Final per-agent state, materialized from the simulation arrays for reporting"""
     id: int
     agent_type: str  # 'reliable', 'unreliable', 'malicious', 'selective'
     rating: float = DEFAULT_RATING
@@ -74,43 +106,17 @@ class Agent:
     completions: int = 0
     disputes_won: int = 0
     disputes_lost: int = 0
-    escrowed: float = 0
 
     # Behavioral parameters
     reliability: float = 0.9  # Probability of completing successfully
     stake_willingness: float = 0.5  # How much of available ELO to stake
 
-    def available_elo(self) -> float:
-        return max(0, self.rating - self.escrowed - MINIMUM_RATING)
-
-    def get_stake(self, max_stake: float = 100) -> float:
-        available = self.available_elo()
-        desired = available * self.stake_willingness
-        return min(desired, max_stake)
-
-    def will_complete(self, counterparty: 'Agent') -> bool:
-        """Decide whether to complete based on agent type"""
-        if self.agent_type == 'reliable':
-            return random.random() < self.reliability
-        elif self.agent_type == 'unreliable':
-            return random.random() < self.reliability
-        elif self.agent_type == 'malicious':
-            # Malicious agents defect more against high-rated agents
-            defect_prob = 0.5 + (counterparty.rating - 1200) / 2000
-            return random.random() > defect_prob
-        elif self.agent_type == 'selective':
-            # Only complete with agents rated within 200 points
-            if abs(self.rating - counterparty.rating) > 200:
-                return random.random() < 0.5
-            return random.random() < 0.95
-        return random.random() < 0.8
-
-
-@dataclass
+
+@dataclass(slots=True)
 class SimulationResult:
     rounds: int
     agents: List[Agent]
-    rating_history: List[Dict[int, float]]
+    rating_history: np.ndarray  # (snapshots, agents)
     total_completions: int
     total_disputes: int
     inflation_rate: float
@@ -118,8 +124,100 @@ class SimulationResult:
     type_avg_ratings: Dict[str, float]
 
 
+# ============ ROUND KERNEL ============
+@_jit
+def _expected(self_rating, opponent_rating):
+    return 1.0 / (1.0 + math.exp((opponent_rating - self_rating) * (LN10 / ELO_DIVISOR)))
+
+
+@_jit
+def _completion_prob(selective, base, slope, self_rating, opponent_rating):
+    if selective:
+        return 0.95 if abs(self_rating - opponent_rating) <= 200 else 0.5
+    return base + slope * (opponent_rating - 1200)
+
+
+@_jit
+def _resolve_round(ratings, k, transactions, completions, disputes_won, disputes_lost,
+                   selective, base, slope, stakes, p, a, u, halve_gains):
+    """Scalar kernel form of ELOSimulation._resolve_round; returns the completion count"""
+    n = ratings.shape[0]
+    scale = 0.5 if halve_gains else 1.0
+    delta = np.zeros(n, dtype=ratings.dtype)
+    completed = 0
+    for m in range(p.shape[0]):
+        i, j = p[m], a[m]
+        r_i, r_j = ratings[i], ratings[j]
+        i_completes = u[m, 0] < _completion_prob(selective[i], base[i], slope[i], r_i, r_j)
+        j_completes = u[m, 1] < _completion_prob(selective[j], base[j], slope[j], r_j, r_i)
+
+        if i_completes and j_completes:
+            delta[i] += max(1.0, np.rint(k[i] * (1 - _expected(r_i, r_j)) * scale))
+            delta[j] += max(1.0, np.rint(k[j] * (1 - _expected(r_j, r_i)) * scale))
+            completions[i] += 1
+            completions[j] += 1
+            completed += 1
+        elif not i_completes and not j_completes:
+            delta[i] -= max(1.0, np.rint(k[i] * _expected(r_i, r_j))) + stakes[i]
+            delta[j] -= max(1.0, np.rint(k[j] * _expected(r_j, r_i))) + stakes[j]
+            disputes_lost[i] += 1
+            disputes_lost[j] += 1
+        else:
+            w, l = (i, j) if i_completes else (j, i)
+            gain = np.rint(max(1.0, np.rint(k[l] * _expected(ratings[l], ratings[w]))) * 0.5) + stakes[l]
+            w_after = max(MINIMUM_RATING, ratings[w] + gain)
+            delta[w] += gain
+            delta[l] -= max(1.0, np.rint(k[l] * _expected(ratings[l], w_after))) + stakes[l]
+            disputes_won[w] += 1
+            disputes_lost[l] += 1
+
+        transactions[i] += 1
+        transactions[j] += 1
+
+    for i in range(n):
+        ratings[i] = max(MINIMUM_RATING, ratings[i] + delta[i])
+    return completed
+
+
 # ============ SIMULATION ============
+def build_population(seed=None, counts: Tuple[int, int, int, int] = (50, 20, 10, 20)) -> Dict[str, np.ndarray]:
+    """Draw agent types and behavioral parameters.
+
+    counts is (reliable, unreliable, malicious, selective); seed is anything
+    np.random.default_rng accepts, including a Generator to draw from.
+    """
+    rng = np.random.default_rng(seed)
+    n = sum(counts)
+    type_code = np.repeat(np.arange(len(AGENT_TYPES), dtype=np.int8), counts)
+    reliability = np.empty(n, dtype=RATING_DTYPE)
+    stake_willingness = np.empty(n, dtype=RATING_DTYPE)
+
+    # Behavioral parameters, drawn agent by agent
+    for i, t in enumerate(type_code):
+        if t == RELIABLE:
+            reliability[i] = rng.uniform(0.85, 0.99)
+            stake_willingness[i] = rng.uniform(0.3, 0.7)
+        elif t == UNRELIABLE:
+            reliability[i] = rng.uniform(0.3, 0.6)
+            stake_willingness[i] = rng.uniform(0.1, 0.3)
+        elif t == MALICIOUS:
+            reliability[i] = 0.3
+            stake_willingness[i] = rng.uniform(0.0, 0.2)
+        else:
+            reliability[i] = 0.9
+            stake_willingness[i] = rng.uniform(0.4, 0.8)
+
+    return {
+        'type_code': type_code,
+        'reliability': reliability,
+        'stake_willingness': stake_willingness,
+    }
+
+
 class ELOSimulation:
+    """Agent state is kept as parallel NumPy arrays indexed by agent id
+    (structure of arrays) rather than one object per agent."""
+
     def __init__(
         self,
         n_reliable: int = 50,
@@ -127,163 +225,195 @@ class ELOSimulation:
         n_malicious: int = 10,
         n_selective: int = 20,
         halve_gains: bool = True,
-        enable_staking: bool = True
+        enable_staking: bool = True,
+        rng: Optional[np.random.Generator] = None,
+        population: Optional[Dict[str, np.ndarray]] = None
     ):
+        """population comes from build_population; when omitted, one is drawn
+        from rng with the n_* counts."""
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.halve_gains = halve_gains
         self.enable_staking = enable_staking
-        self.agents: List[Agent] = []
-        self.rating_history: List[Dict[int, float]] = []
         self.total_completions = 0
         self.total_disputes = 0
 
-        # Create agents
-        agent_id = 0
-        for _ in range(n_reliable):
-            self.agents.append(Agent(
-                id=agent_id,
-                agent_type='reliable',
-                reliability=random.uniform(0.85, 0.99),
-                stake_willingness=random.uniform(0.3, 0.7)
-            ))
-            agent_id += 1
-
-        for _ in range(n_unreliable):
-            self.agents.append(Agent(
-                id=agent_id,
-                agent_type='unreliable',
-                reliability=random.uniform(0.3, 0.6),
-                stake_willingness=random.uniform(0.1, 0.3)
-            ))
-            agent_id += 1
-
-        for _ in range(n_malicious):
-            self.agents.append(Agent(
-                id=agent_id,
-                agent_type='malicious',
-                reliability=0.3,
-                stake_willingness=random.uniform(0.0, 0.2)
-            ))
-            agent_id += 1
-
-        for _ in range(n_selective):
-            self.agents.append(Agent(
-                id=agent_id,
-                agent_type='selective',
-                reliability=0.9,
-                stake_willingness=random.uniform(0.4, 0.8)
+        if population is None:
+            population = build_population(self.rng, (n_reliable, n_unreliable, n_malicious, n_selective))
+        self.type_code = population['type_code']
+        self.reliability = population['reliability']
+        self.stake_willingness = population['stake_willingness']
+
+        n = len(self.type_code)
+        self.ratings = np.full(n, DEFAULT_RATING, dtype=RATING_DTYPE)
+        self.transactions = np.zeros(n, dtype=np.int64)
+        self.completions = np.zeros(n, dtype=np.int64)
+        self.disputes_won = np.zeros(n, dtype=np.int64)
+        self.disputes_lost = np.zeros(n, dtype=np.int64)
+        self.k_per_agent = np.full(n, K_LOOKUP[0])
+        self.rating_history = np.empty((0, n), dtype=np.float32)
+        self._snap_idx = 0
+
+        # Completion probability against an opponent rated r is
+        # base + slope * (r - 1200), except for selective agents, who
+        # switch on the rating gap. Malicious agents defect more against
+        # high-rated agents: 1 - (0.5 + (r - 1200) / 2000).
+        malicious = self.type_code == MALICIOUS
+        self.selective = self.type_code == SELECTIVE
+        self.complete_base = np.where(malicious, 0.5, self.reliability).astype(RATING_DTYPE)
+        self.complete_slope = np.where(malicious, -1 / 2000, 0.0).astype(RATING_DTYPE)
+
+    @property
+    def agents(self) -> List[Agent]:
+        """Materialize per-agent records from the state arrays"""
+        return [
+            Agent(
+                id=i,
+                agent_type=AGENT_TYPES[t],
+                rating=r,
+                transactions=tx,
+                completions=c,
+                disputes_won=w,
+                disputes_lost=l,
+                reliability=rel,
+                stake_willingness=sw,
+            )
+            for i, (t, r, tx, c, w, l, rel, sw) in enumerate(zip(
+                self.type_code.tolist(), self.ratings.tolist(), self.transactions.tolist(),
+                self.completions.tolist(), self.disputes_won.tolist(),
+                self.disputes_lost.tolist(),
+                self.reliability.tolist(), self.stake_willingness.tolist(),
             ))
-            agent_id += 1
+        ]
 
     def record_ratings(self):
-        """Snapshot current ratings"""
-        self.rating_history.append({
-            a.id: a.rating for a in self.agents
-        })
-
-    def process_interaction(self, proposer: Agent, acceptor: Agent):
-        """Process a single proposal interaction"""
-        # Determine stakes
-        proposer_stake = proposer.get_stake() if self.enable_staking else 0
-        acceptor_stake = acceptor.get_stake() if self.enable_staking else 0
+        """Snapshot current ratings into the next row of rating_history"""
+        self.rating_history[self._snap_idx] = self.ratings
+        self._snap_idx += 1
+
+    def completion_prob(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Probability that each agent in i completes with its counterparty in j"""
+        prob = self.complete_base[i] + self.complete_slope[i] * (self.ratings[j] - 1200)
+
+        # Selective agents only reliably complete with agents rated within 200 points
+        near = np.abs(self.ratings[i] - self.ratings[j]) <= 200
+        return np.where(self.selective[i], np.where(near, 0.95, 0.5), prob)
+
+    def play_round(self, n_interactions: int):
+        """Resolve a whole round of proposal interactions at once.
+
+        Every interaction in the round is priced off the ratings, K-factors
+        and stakes as they stood at the start of the round, and the rating
+        changes are applied together at the end. This approximates playing
+        them one after another; interactions_per_round is the knob, with
+        smaller rounds tracking the sequential process more closely.
+        """
+        ratings = self.ratings
+        n = len(ratings)
 
-        # Escrow stakes
-        proposer.escrowed += proposer_stake
-        acceptor.escrowed += acceptor_stake
+        # Select two different agents per interaction (weighted by rating for "market" effect)
+        weights = np.maximum(ratings - MINIMUM_RATING, 1)
+        cum = np.cumsum(weights)
+        u = self.rng.random((n_interactions, 2), dtype=RATING_DTYPE)
+        # u * total can round up to total itself in float32, hence the clamps
+        p = np.minimum(np.searchsorted(cum, u[:, 0] * cum[-1], side='right'), n - 1)
+        # Draw the acceptor from the remaining weight and step over the
+        # proposer's slice of the cumulative range, so pairs never collide
+        x = u[:, 1] * (cum[-1] - weights[p])
+        x += np.where(x >= cum[p] - weights[p], weights[p], 0)
+        a = np.minimum(np.searchsorted(cum, x, side='right'), n - 1)
+
+        # Stakes are escrowed for the interaction and always returned or burned
+        # by its end, so they come straight off the rating available at round start
+        if self.enable_staking:
+            stakes = np.minimum(np.maximum(ratings - MINIMUM_RATING, 0) * self.stake_willingness, 100)
+        else:
+            stakes = np.zeros(n, dtype=RATING_DTYPE)
 
         # Determine outcome
-        proposer_completes = proposer.will_complete(acceptor)
-        acceptor_completes = acceptor.will_complete(proposer)
-
-        k_proposer = get_k_factor(proposer.transactions)
-        k_acceptor = get_k_factor(acceptor.transactions)
-
-        if proposer_completes and acceptor_completes:
-            # COMPLETE - both gain (halved), stakes returned
-            gain_proposer = calculate_completion_gain(
-                proposer.rating, acceptor.rating, k_proposer, self.halve_gains
+        u = self.rng.random((n_interactions, 2), dtype=RATING_DTYPE)
+        if njit is not None:
+            completed = _resolve_round(
+                ratings, self.k_per_agent, self.transactions,
+                self.completions, self.disputes_won, self.disputes_lost,
+                self.selective, self.complete_base, self.complete_slope, stakes, p, a, u, self.halve_gains
             )
-            gain_acceptor = calculate_completion_gain(
-                acceptor.rating, proposer.rating, k_acceptor, self.halve_gains
-            )
-
-            proposer.rating = max(MINIMUM_RATING, proposer.rating + gain_proposer)
-            acceptor.rating = max(MINIMUM_RATING, acceptor.rating + gain_acceptor)
-            proposer.completions += 1
-            acceptor.completions += 1
-            self.total_completions += 1
-
-            # Return stakes
-            proposer.escrowed -= proposer_stake
-            acceptor.escrowed -= acceptor_stake
-
-        elif not proposer_completes and not acceptor_completes:
-            # MUTUAL FAULT - both lose, both stakes burned
-            loss_proposer = calculate_dispute_loss(
-                proposer.rating, acceptor.rating, k_proposer
-            ) + proposer_stake
-            loss_acceptor = calculate_dispute_loss(
-                acceptor.rating, proposer.rating, k_acceptor
-            ) + acceptor_stake
-
-            proposer.rating = max(MINIMUM_RATING, proposer.rating - loss_proposer)
-            acceptor.rating = max(MINIMUM_RATING, acceptor.rating - loss_acceptor)
-            proposer.disputes_lost += 1
-            acceptor.disputes_lost += 1
-            self.total_disputes += 1
-
-            # Stakes burned (already escrowed, just clear)
-            proposer.escrowed -= proposer_stake
-            acceptor.escrowed -= acceptor_stake
-
         else:
-            # ONE PARTY AT FAULT - winner gains some, loser loses + stake transfer
-            if proposer_completes:
-                # Acceptor at fault
-                winner, loser = proposer, acceptor
-                winner_stake, loser_stake = proposer_stake, acceptor_stake
-                k_winner, k_loser = k_proposer, k_acceptor
-            else:
-                # Proposer at fault
-                winner, loser = acceptor, proposer
-                winner_stake, loser_stake = acceptor_stake, proposer_stake
-                k_winner, k_loser = k_acceptor, k_proposer
-
-            # Winner gains partial + loser's stake
-            win_gain = round(calculate_dispute_loss(loser.rating, winner.rating, k_loser) * 0.5)
-            winner.rating = max(MINIMUM_RATING, winner.rating + win_gain + loser_stake)
-
-            # Loser loses full + their stake
-            lose_loss = calculate_dispute_loss(loser.rating, winner.rating, k_loser) + loser_stake
-            loser.rating = max(MINIMUM_RATING, loser.rating - lose_loss)
-
-            winner.disputes_won += 1
-            loser.disputes_lost += 1
-            self.total_disputes += 1
-
-            # Clear escrows
-            proposer.escrowed -= proposer_stake
-            acceptor.escrowed -= acceptor_stake
-
-        # Update transaction counts
-        proposer.transactions += 1
-        acceptor.transactions += 1
+            completed = self._resolve_round(p, a, stakes, u)
+        self.total_completions += completed
+        self.total_disputes += n_interactions - completed
+        self.k_per_agent = K_LOOKUP[np.minimum(self.transactions, TRANSACTIONS_INTERMEDIATE)]
+
+    def _resolve_round(self, p: np.ndarray, a: np.ndarray, stakes: np.ndarray, u: np.ndarray) -> int:
+        """Apply the outcomes of a round's pairings p/a given outcome uniforms u"""
+        ratings = self.ratings
+        n = len(ratings)
+        k = self.k_per_agent
+        stake_p, stake_a = stakes[p], stakes[a]
+
+        p_completes = u[:, 0] < self.completion_prob(p, a)
+        a_completes = u[:, 1] < self.completion_prob(a, p)
+        both = p_completes & a_completes
+        neither = ~p_completes & ~a_completes
+        one = p_completes ^ a_completes
+
+        k_p, k_a = k[p], k[a]
+        expected_p = expected_scores(ratings[p], ratings[a])
+        expected_a = expected_scores(ratings[a], ratings[p])
+        delta_p = np.zeros(len(p), dtype=RATING_DTYPE)
+        delta_a = np.zeros(len(p), dtype=RATING_DTYPE)
+
+        # COMPLETE - both gain (halved), stakes returned
+        scale = 0.5 if self.halve_gains else 1.0
+        delta_p += np.where(both, np.maximum(1, np.rint(k_p * (1 - expected_p) * scale)), 0)
+        delta_a += np.where(both, np.maximum(1, np.rint(k_a * (1 - expected_a) * scale)), 0)
+
+        # MUTUAL FAULT - both lose, both stakes burned
+        delta_p -= np.where(neither, np.maximum(1, np.rint(k_p * expected_p)) + stake_p, 0)
+        delta_a -= np.where(neither, np.maximum(1, np.rint(k_a * expected_a)) + stake_a, 0)
+
+        # ONE PARTY AT FAULT - winner gains some, loser loses + stake transfer
+        winner = np.where(p_completes, p, a)
+        loser = np.where(p_completes, a, p)
+        loser_stake = np.where(p_completes, stake_a, stake_p)
+        k_loser = k[loser]
+
+        # Winner gains partial + loser's stake
+        win_gain = np.rint(np.maximum(1, np.rint(k_loser * expected_scores(ratings[loser], ratings[winner]))) * 0.5)
+        winner_delta = win_gain + loser_stake
+
+        # Loser loses full + their stake, priced against the winner's new rating
+        winner_after = np.maximum(MINIMUM_RATING, ratings[winner] + winner_delta)
+        loser_delta = -(np.maximum(1, np.rint(k_loser * expected_scores(ratings[loser], winner_after))) + loser_stake)
+
+        delta_p += np.where(one, np.where(p_completes, winner_delta, loser_delta), 0)
+        delta_a += np.where(one, np.where(p_completes, loser_delta, winner_delta), 0)
+
+        # Apply rating changes; np.add.at accumulates agents seen more than once
+        delta = np.zeros(n, dtype=RATING_DTYPE)
+        np.add.at(delta, p, delta_p)
+        np.add.at(delta, a, delta_a)
+        np.maximum(ratings + delta, MINIMUM_RATING, out=ratings)
+
+        np.add.at(self.completions, p[both], 1)
+        np.add.at(self.completions, a[both], 1)
+        np.add.at(self.disputes_lost, p[neither], 1)
+        np.add.at(self.disputes_lost, a[neither], 1)
+        np.add.at(self.disputes_won, winner[one], 1)
+        np.add.at(self.disputes_lost, loser[one], 1)
+        np.add.at(self.transactions, p, 1)
+        np.add.at(self.transactions, a, 1)
+        return int(both.sum())
 
     def run(self, rounds: int = 1000, interactions_per_round: int = 50) -> SimulationResult:
         """Run the simulation"""
+        # Initial snapshot, one every 10 rounds, and a final one
+        n_snapshots = (rounds + 9) // 10 + 2
+        self.rating_history = np.empty((n_snapshots, len(self.ratings)), dtype=np.float32)
+        self._snap_idx = 0
         self.record_ratings()
 
         for round_num in range(rounds):
-            # Random pairings for this round
-            for _ in range(interactions_per_round):
-                # Select two different agents (weighted by rating for "market" effect)
-                weights = [max(1, a.rating - MINIMUM_RATING) for a in self.agents]
-                proposer, acceptor = random.choices(self.agents, weights=weights, k=2)
-
-                # Ensure different agents
-                while proposer.id == acceptor.id:
-                    acceptor = random.choices(self.agents, weights=weights, k=1)[0]
-
-                self.process_interaction(proposer, acceptor)
+            self.play_round(interactions_per_round)
 
             # Record every 10 rounds
             if round_num % 10 == 0:
@@ -297,22 +427,20 @@ class ELOSimulation:
     def get_results(self, rounds: int) -> SimulationResult:
         """Compile simulation results"""
         # Calculate inflation
-        initial_total = sum(self.rating_history[0].values())
-        final_total = sum(a.rating for a in self.agents)
+        initial_total = float(self.rating_history[0].sum())
+        final_total = float(self.ratings.sum())
         inflation_rate = (final_total - initial_total) / initial_total
 
         # Calculate Gini coefficient (inequality measure)
-        ratings = sorted([a.rating for a in self.agents])
+        ratings = np.sort(self.ratings)
         n = len(ratings)
-        cumulative = sum((i + 1) * r for i, r in enumerate(ratings))
-        gini = (2 * cumulative) / (n * sum(ratings)) - (n + 1) / n
+        gini = float(2 * (np.arange(1, n + 1) @ ratings) / (n * ratings.sum()) - (n + 1) / n)
 
         # Average rating by type
-        type_ratings = defaultdict(list)
-        for a in self.agents:
-            type_ratings[a.agent_type].append(a.rating)
-
-        type_avg = {t: statistics.mean(rs) for t, rs in type_ratings.items()}
+        type_avg = {
+            AGENT_TYPES[t]: float(self.ratings[self.type_code == t].mean())
+            for t in np.unique(self.type_code).tolist()
+        }
 
         return SimulationResult(
             rounds=rounds,
@@ -356,11 +484,12 @@ def print_results(result: SimulationResult, label: str):
               f"[{a.completions}C/{a.disputes_won}W/{a.disputes_lost}L]")
 
     # Rating distribution
-    ratings = [a.rating for a in result.agents]
+    ratings = np.array([a.rating for a in result.agents])
+    lowest, median, highest = np.percentile(ratings, [0, 50, 100])
     print(f"\nRating Distribution:")
-    print(f"  Min: {min(ratings):.0f}, Max: {max(ratings):.0f}")
-    print(f"  Mean: {statistics.mean(ratings):.0f}, Median: {statistics.median(ratings):.0f}")
-    print(f"  Std Dev: {statistics.stdev(ratings):.0f}")
+    print(f"  Min: {lowest:.0f}, Max: {highest:.0f}")
+    print(f"  Mean: {ratings.mean():.0f}, Median: {median:.0f}")
+    print(f"  Std Dev: {ratings.std(ddof=1):.0f}")
 
 
 def analyze_dynamics(result: SimulationResult):
@@ -372,9 +501,8 @@ def analyze_dynamics(result: SimulationResult):
     indices = [0, n_snapshots//4, n_snapshots//2, 3*n_snapshots//4, n_snapshots-1]
 
     # Track by type
-    type_ids = defaultdict(list)
-    for a in result.agents:
-        type_ids[a.agent_type].append(a.id)
+    agent_types = np.array([a.agent_type for a in result.agents])
+    type_masks = {t: agent_types == t for t in AGENT_TYPES}
 
     print(f"\n{'Progress':<10}", end="")
     for t in ['reliable', 'unreliable', 'malicious', 'selective']:
@@ -387,14 +515,30 @@ def analyze_dynamics(result: SimulationResult):
         progress = idx / (n_snapshots - 1) * 100
         print(f"{progress:>6.0f}%   ", end="")
         for t in ['reliable', 'unreliable', 'malicious', 'selective']:
-            avg = statistics.mean(snapshot[aid] for aid in type_ids[t])
+            avg = snapshot[type_masks[t]].mean()
             print(f"{avg:>12.0f}", end="")
         print()
 
 
+def _run_config(config: Tuple[dict, dict]) -> SimulationResult:
+    """Build and run one simulation from (constructor kwargs, run kwargs)"""
+    sim_kwargs, run_kwargs = config
+    return ELOSimulation(**sim_kwargs).run(**run_kwargs)
+
+
+def run_parallel(configs: List[Tuple[dict, dict]]) -> List[SimulationResult]:
+    """Run independent simulations in worker processes, results in input order"""
+    with ProcessPoolExecutor(max_workers=min(len(configs), os.cpu_count() or 1)) as pool:
+        return list(pool.map(_run_config, configs))
+
+
 def run_comparison():
     """Compare different configurations"""
-    random.seed(42)  # Reproducibility
+    # All configurations share one population, so differences come only from
+    # the gain/staking rules; each still plays out on its own stream
+    rng = np.random.default_rng(SEED)
+    population = build_population(rng)
+    streams = rng.spawn(4)
 
     print("\n" + "="*70)
     print(" ELO SWARM SIMULATION - EMPIRICAL VALIDATION")
@@ -402,32 +546,29 @@ def run_comparison():
     print("\nAgent Distribution: 50 reliable, 20 unreliable, 10 malicious, 20 selective")
     print("Running 1000 rounds with 50 interactions each (50,000 total interactions)")
 
-    # Test 1: Full gains (no halving) - should show inflation
-    print("\n[1/4] Running: Full Gains (no halving), No Staking...")
-    sim1 = ELOSimulation(halve_gains=False, enable_staking=False)
-    result1 = sim1.run(rounds=1000)
-    print_results(result1, "FULL GAINS, NO STAKING (baseline)")
-
-    # Test 2: Halved gains - should control inflation
-    print("\n[2/4] Running: Halved Gains, No Staking...")
-    random.seed(42)
-    sim2 = ELOSimulation(halve_gains=True, enable_staking=False)
-    result2 = sim2.run(rounds=1000)
-    print_results(result2, "HALVED GAINS, NO STAKING")
-
-    # Test 3: Halved gains + staking
-    print("\n[3/4] Running: Halved Gains + Staking...")
-    random.seed(42)
-    sim3 = ELOSimulation(halve_gains=True, enable_staking=True)
-    result3 = sim3.run(rounds=1000)
-    print_results(result3, "HALVED GAINS + STAKING (our system)")
-
-    # Test 4: Full gains + staking (for comparison)
-    print("\n[4/4] Running: Full Gains + Staking...")
-    random.seed(42)
-    sim4 = ELOSimulation(halve_gains=False, enable_staking=True)
-    result4 = sim4.run(rounds=1000)
-    print_results(result4, "FULL GAINS + STAKING")
+    tests = [
+        # Test 1: Full gains (no halving) - should show inflation
+        ("Full Gains (no halving), No Staking", "FULL GAINS, NO STAKING (baseline)",
+         dict(halve_gains=False, enable_staking=False)),
+        # Test 2: Halved gains - should control inflation
+        ("Halved Gains, No Staking", "HALVED GAINS, NO STAKING",
+         dict(halve_gains=True, enable_staking=False)),
+        # Test 3: Halved gains + staking
+        ("Halved Gains + Staking", "HALVED GAINS + STAKING (our system)",
+         dict(halve_gains=True, enable_staking=True)),
+        # Test 4: Full gains + staking (for comparison)
+        ("Full Gains + Staking", "FULL GAINS + STAKING",
+         dict(halve_gains=False, enable_staking=True)),
+    ]
+    for i, (label, _, _) in enumerate(tests, 1):
+        print(f"\n[{i}/{len(tests)}] Running: {label}...")
+    results = run_parallel([
+        (dict(params, rng=rng, population=population), dict(rounds=1000))
+        for (_, _, params), rng in zip(tests, streams)
+    ])
+    for (_, title, _), result in zip(tests, results):
+        print_results(result, title)
+    result1, result2, result3, result4 = results
 
     # Summary comparison
     print("\n" + "="*70)
@@ -498,7 +639,7 @@ def run_comparison():
     # Stake impact
     print("\nStake Impact Analysis:")
     reliable_with_stake = [a for a in result3.agents if a.agent_type == 'reliable']
-    avg_stake_willing = statistics.mean(a.stake_willingness for a in reliable_with_stake)
+    avg_stake_willing = np.mean([a.stake_willingness for a in reliable_with_stake])
     print(f"  Avg stake willingness (reliable): {avg_stake_willing:.1%}")
     print(f"  Stake amplifies differentiation by transferring ELO from losers to winners")
     print(f"  Gini increase: {result2.gini_coefficient:.3f} → {result3.gini_coefficient:.3f}")
@@ -522,17 +663,24 @@ def run_equilibrium_analysis():
         ("Very adversarial (20/30/30/20)", (20, 30, 30, 20)),
     ]
 
-    for label, (rel, unrel, mal, sel) in configs:
-        random.seed(42)
-        sim = ELOSimulation(
-            n_reliable=rel,
-            n_unreliable=unrel,
-            n_malicious=mal,
-            n_selective=sel,
-            halve_gains=True,
-            enable_staking=True
+    streams = np.random.default_rng(SEED).spawn(len(configs))
+    results = run_parallel([
+        (
+            dict(
+                n_reliable=rel,
+                n_unreliable=unrel,
+                n_malicious=mal,
+                n_selective=sel,
+                halve_gains=True,
+                enable_staking=True,
+                rng=rng
+            ),
+            dict(rounds=500, interactions_per_round=30),
         )
-        result = sim.run(rounds=500, interactions_per_round=30)
+        for (_, (rel, unrel, mal, sel)), rng in zip(configs, streams)
+    ])
+
+    for (label, _), result in zip(configs, results):
         comp_rate = result.total_completions / (result.total_completions + result.total_disputes)
         rel_avg = result.type_avg_ratings.get('reliable', 0)
         print(f"{label:<30} {comp_rate:>11.1%} {result.inflation_rate:>+11.1%} {rel_avg:>14.0f}")
@@ -544,8 +692,7 @@ def run_long_term_stability():
     print(" LONG-TERM STABILITY TEST")
     print("="*70)
 
-    random.seed(42)
-    sim = ELOSimulation(halve_gains=True, enable_staking=True)
+    sim = ELOSimulation(halve_gains=True, enable_staking=True, rng=np.random.default_rng(SEED))
     result = sim.run(rounds=2000, interactions_per_round=50)
 
     print(f"\nAfter 2000 rounds (100,000 interactions):")
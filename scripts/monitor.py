@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
-"""Simple blocking monitor - polls until messages arrive, then prints and exits.
+"""Simple blocking monitor - waits until messages arrive, then prints and exits.
+
+On Linux it sleeps on inotify until the newdata semaphore or stop file
+appears; elsewhere it polls every interval seconds.
 
 Exit codes:
   0  - Normal exit (messages found, timeout, or interrupt)
@@ -9,11 +12,21 @@ To stop monitoring: touch .agentchat/stop
 """
 
 import json
+import os
+import select
 import signal
 import sys
+import tempfile
 import time
+import zlib
 from pathlib import Path
 
+try:
+    # Same optional parser as lib/chat.py; inbox lines are parsed as bytes
+    from orjson import JSONDecodeError, loads
+except ImportError:
+    from json import JSONDecodeError, loads
+
 # Flag to track if we should exit
 _shutdown = False
 
@@ -31,8 +44,66 @@ DAEMON_DIR = Path(".agentchat/daemons/default")
 NEWDATA = DAEMON_DIR / "newdata"
 INBOX = DAEMON_DIR / "inbox.jsonl"
 LAST_TS = DAEMON_DIR / "last_ts"
+# Inbox cursor shared with lib/chat.py: same file and "offset inode crc ts"
+# format, so either tool resumes from wherever the other advanced last_ts
+LAST_OFF = DAEMON_DIR / "last_off"
 STOP_FILE = Path(".agentchat/stop")
 
+# Mirrors the inotify helpers in lib/chat.py, since this script runs
+# standalone and can't import them; fix event parsing in both places.
+IN_MODIFY = 0x002
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+
+def inotify_watch(dirs):
+    """Open a non-blocking inotify fd watching dirs, or None if unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    import ctypes
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+
+    for d in dirs:
+        if libc.inotify_add_watch(fd, os.fsencode(d), IN_CREATE | IN_MOVED_TO | IN_MODIFY) < 0:
+            os.close(fd)
+            return None
+    return fd
+
+def inotify_names(fd):
+    """Drain pending inotify events and return the file names they touched."""
+    import struct
+
+    names = set()
+    while True:
+        try:
+            buf = os.read(fd, 4096)
+        except BlockingIOError:
+            return names
+        pos = 0
+        while pos < len(buf):
+            _, _, _, size = struct.unpack_from("iIII", buf, pos)
+            pos += 16
+            names.add(os.fsdecode(buf[pos:pos + size].rstrip(b"\0")))
+            pos += size
+
+def wait_for_change(poller, fd, names, deadline):
+    """Block until one of names changes or deadline passes.
+
+    Signals still end the wait: the handlers raise SystemExit out of poll().
+    """
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if not poller.poll(remaining) or inotify_names(fd) & names:
+            return
+
 def get_last_ts():
     if LAST_TS.exists():
         return int(LAST_TS.read_text().strip())
@@ -41,31 +112,117 @@ def get_last_ts():
 def set_last_ts(ts):
     LAST_TS.write_text(str(ts))
 
+def line_crc(fd, end):
+    """crc32 of the line ending at byte offset end, as lib/chat.py computes it."""
+    window = 4096
+    while True:
+        start = max(0, end - window)
+        buf = os.pread(fd, end - start, start)
+        nl = buf.rfind(b'\n', 0, len(buf) - 1)
+        if nl != -1 or start == 0:
+            return zlib.crc32(buf[nl + 1:])
+        window *= 2
+
+def get_offset(f, since):
+    """Inbox offset to resume from, or 0 if the stored cursor doesn't apply.
+
+    The cursor only counts if it was written for the current last_ts (which
+    may have been rewound), for this inode, and the line ending at its offset
+    still has the same crc32 (the daemon trims the inbox in place).
+    """
+    try:
+        off, ino, crc, ts = map(int, LAST_OFF.read_text().split())
+    except (FileNotFoundError, ValueError):
+        return 0
+    st = os.fstat(f.fileno())
+    if ts != since or ino != st.st_ino or not 0 < off <= st.st_size:
+        return 0
+    if line_crc(f.fileno(), off) != crc:
+        return 0
+    return off
+
+def advance(ts, cursor):
+    """Mark ts as seen, publishing the cursor first so it never outruns last_ts."""
+    if cursor is not None:
+        # Unique temp name: chat.py may be publishing a cursor at the same time
+        fd, tmp = tempfile.mkstemp(dir=DAEMON_DIR, prefix=LAST_OFF.name + '.')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write("%d %d %d %d" % (*cursor, ts))
+            os.replace(tmp, LAST_OFF)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    set_last_ts(ts)
+
+# (st_mtime_ns, st_size) of the inbox as of the last read
+_last_inbox_stat = None
+
 def read_new_messages():
-    since = get_last_ts()
+    """Return (messages, cursor); pass the cursor to advance() once they are out."""
+    global _last_inbox_stat
     messages = []
-    if not INBOX.exists():
-        return messages
+    try:
+        st = INBOX.stat()
+    except FileNotFoundError:
+        return messages, None
+    # Unchanged since the last read (size guards against coarse mtimes)
+    inbox_stat = (st.st_mtime_ns, st.st_size)
+    if inbox_stat == _last_inbox_stat:
+        return messages, None
 
-    for line in INBOX.read_text().strip().split('\n'):
-        if not line:
-            continue
-        try:
-            msg = json.loads(line)
-            # Filter out replay messages and @server noise (welcome messages, etc.)
-            if msg.get('ts', 0) > since and not msg.get('replay') and msg.get('from') != '@server':
-                messages.append(msg)
-        except json.JSONDecodeError:
-            continue
+    since = get_last_ts()
+    with open(INBOX, 'rb') as f:
+        off = get_offset(f, since)
+        f.seek(off)
+        last_line = None
+        skipped = []  # (offset, ts) of unseen lines filtered out below
+        for line in f:
+            if not line.endswith(b'\n'):
+                break  # Partial line still being written by the daemon
+            start = off
+            off += len(line)
+            last_line = line
+            try:
+                msg = loads(line)
+                ts = msg.get('ts', 0)
+                # Filter out replay messages and @server noise (welcome messages, etc.)
+                if ts > since and not msg.get('replay') and msg.get('from') != '@server':
+                    messages.append(msg)
+                elif ts > since:
+                    skipped.append((start, ts))
+            except JSONDecodeError:
+                continue
+        # Same rule as lib/chat.py: never move the cursor past a filtered
+        # line newer than the last_ts we are about to publish, since check
+        # and poll still show it
+        max_ts = max((m.get('ts', 0) for m in messages), default=since)
+        resume = min((o for o, ts in skipped if ts > max_ts), default=off)
+        ino = os.fstat(f.fileno()).st_ino
+        if resume < off:
+            cursor = (resume, ino, line_crc(f.fileno(), resume)) if resume else None
+        elif last_line is not None:
+            cursor = (off, ino, zlib.crc32(last_line))
+        elif off:
+            cursor = (off, ino, line_crc(f.fileno(), off))
+        else:
+            cursor = None
+    _last_inbox_stat = inbox_stat
 
-    return sorted(messages, key=lambda m: m.get('ts', 0))
+    return sorted(messages, key=lambda m: m.get('ts', 0)), cursor
 
 def main():
     interval = float(sys.argv[1]) if len(sys.argv) > 1 else 5
     max_wait = float(sys.argv[2]) if len(sys.argv) > 2 else 300  # 5 min default
 
-    start = time.time()
-    while not _shutdown and time.time() - start < max_wait:
+    watch_fd = inotify_watch([DAEMON_DIR, STOP_FILE.parent])
+    if watch_fd is not None:
+        poller = select.epoll()
+        poller.register(watch_fd, select.EPOLLIN)
+    watch_names = {NEWDATA.name, STOP_FILE.name}
+
+    deadline = time.monotonic() + max_wait
+    while not _shutdown and time.monotonic() < deadline:
         # Check for stop file - allows clean shutdown of monitoring loop
         if STOP_FILE.exists():
             try:
@@ -74,11 +231,8 @@ def main():
                 pass
             sys.exit(42)  # Special exit code signals "stop monitoring"
         if NEWDATA.exists():
-            messages = read_new_messages()
+            messages, cursor = read_new_messages()
             if messages:
-                # Update timestamp
-                max_ts = max(m.get('ts', 0) for m in messages)
-                set_last_ts(max_ts)
                 # Delete semaphore
                 try:
                     NEWDATA.unlink()
@@ -87,6 +241,9 @@ def main():
                 # Output messages
                 for msg in messages:
                     print(json.dumps(msg))
+                sys.stdout.flush()
+                # Update timestamp and cursor only once the messages are out
+                advance(max(m.get('ts', 0) for m in messages), cursor)
                 return
             # Semaphore but no new messages after filtering
             try:
@@ -94,7 +251,10 @@ def main():
             except FileNotFoundError:
                 pass
         try:
-            time.sleep(interval)
+            if watch_fd is None:
+                time.sleep(interval)
+            else:
+                wait_for_change(poller, watch_fd, watch_names, deadline)
         except KeyboardInterrupt:
             return
 